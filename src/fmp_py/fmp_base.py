@@ -1,15 +1,22 @@
 import os
 import pandas as pd
+import pendulum
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 from dotenv import load_dotenv
-from typing import Dict, Any
+from typing import Dict, Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 load_dotenv()
 
 FMP_API_KEY = os.getenv("FMP_API_KEY", "")
 FMP_BASE_URL = "https://financialmodelingprep.com/api/"
+EXCHANGE_TIMEZONE = "America/New_York"
 
 
 class FmpBase:
@@ -37,6 +44,41 @@ class FmpBase:
         self.session = requests.Session()
         self.session.mount("https://", self.adapter)
         self.session.mount("http://", self.adapter)
+        self.cache_enabled = False
+        self.closed_expire_after = None
+
+    def enable_cache(
+        self,
+        cache_name: str = "fmp_cache",
+        expire_after: Union[int, float] = 3600,
+        closed_expire_after: Union[int, float] = 7 * 24 * 3600,
+    ) -> None:
+        """
+        Serve repeated requests from an on-disk SQLite response cache.
+
+        Responses expire after expire_after seconds. Requests whose "to" date ended
+        before yesterday on the US exchange calendar cover a closed window, so they are
+        kept for the longer closed_expire_after instead. That is still finite, because
+        split and dividend adjustments can rewrite closed windows later.
+
+        Args:
+            cache_name (str): Path of the SQLite cache file, without the extension. Defaults to "fmp_cache".
+            expire_after (Union[int, float]): Seconds before a cached response expires. Defaults to 3600.
+            closed_expire_after (Union[int, float]): Seconds before a cached closed-window response expires. Defaults to 7 days.
+        """
+        from requests_cache import CachedSession
+
+        self.session.close()
+        self.session = CachedSession(
+            cache_name=cache_name,
+            backend="sqlite",
+            expire_after=expire_after,
+            ignored_parameters=["apikey"],
+        )
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        self.cache_enabled = True
+        self.closed_expire_after = closed_expire_after
 
     def fill_na(self, df: pd.DataFrame) -> pd.DataFrame:
         for col in df:
@@ -78,13 +120,23 @@ class FmpBase:
         params["apikey"] = self.api_key
         full_url = f"{FMP_BASE_URL}{url}"
 
+        request_kwargs = {}
+        to_date = str(params.get("to") or "")[:10]
+        if self.cache_enabled and to_date:
+            # Yesterday in local time can still be an open session in New York
+            yesterday = pendulum.today(EXCHANGE_TIMEZONE).subtract(days=1)
+            if to_date < yesterday.to_date_string():
+                request_kwargs["expire_after"] = self.closed_expire_after
+
         try:
-            response = self.session.get(full_url, params=params)
+            response = self.session.get(full_url, params=params, **request_kwargs)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             raise Exception(f"Request failed: {e}")
 
         try:
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
         except ValueError:
             raise Exception("Failed to parse JSON response")
@@ -1,13 +1,12 @@
+import numpy as np
 import pandas as pd
-from fmp_py.fmp_base import FmpBase
+from numpy.lib.stride_tricks import sliding_window_view
 import os
-from dotenv import load_dotenv
 
 from fmp_py.fmp_historical_data import FmpHistoricalData
 from ta.trend import (
     SMAIndicator,
     EMAIndicator,
-    WMAIndicator,
     ADXIndicator,
     MACD,
     VortexIndicator,
@@ -53,10 +52,8 @@ from ta.volatility import (
     # UlcerIndex,
 )
 
-load_dotenv()
 
-
-class FmpChartData(FmpBase):
+class FmpChartData(FmpHistoricalData):
     def __init__(
         self,
         symbol: str,
@@ -66,7 +63,8 @@ class FmpChartData(FmpBase):
         api_key: str = os.getenv("FMP_API_KEY"),
     ) -> None:
         super().__init__(api_key)
-        self.chart = FmpHistoricalData().intraday_history(
+        # Fetch through this client's own session and API key
+        self.chart = self.intraday_history(
             symbol=symbol, interval=interval, from_date=from_date, to_date=to_date
         )
 
@@ -608,12 +606,12 @@ class FmpChartData(FmpBase):
         )
 
         def t3(src, length):
-            xe1_1 = EMAIndicator(src, length).ema_indicator()
-            xe2_1 = EMAIndicator(xe1_1, length).ema_indicator()
-            xe3_1 = EMAIndicator(xe2_1, length).ema_indicator()
-            xe4_1 = EMAIndicator(xe3_1, length).ema_indicator()
-            xe5_1 = EMAIndicator(xe4_1, length).ema_indicator()
-            xe6_1 = EMAIndicator(xe5_1, length).ema_indicator()
+            # Six chained EMAs, computed directly with ewm.
+            emas = []
+            for _ in range(6):
+                src = src.ewm(span=length, min_periods=length, adjust=False).mean()
+                emas.append(src)
+            _, _, xe3_1, xe4_1, xe5_1, xe6_1 = emas
             b_1 = 0.7
             c1_1 = -b_1 * b_1 * b_1
             c2_1 = 3 * b_1 * b_1 + 3 * b_1 * b_1 * b_1
@@ -1001,9 +999,8 @@ class FmpChartData(FmpBase):
             bb = BollingerBands(close=close, window=channel_period, window_dev=mul)
             return bb.bollinger_hband(), bb.bollinger_lband()
 
-        macd_diff = calc_macd(df["close"], n_fast, n_slow) - calc_macd(
-            df["close"].shift(1), n_fast, n_slow
-        )
+        # The MACD of the shifted close is the shifted MACD, so compute it once
+        macd_diff = calc_macd(df["close"], n_fast, n_slow).diff()
         explosion = macd_diff * sensitivity
 
         bb_upper, bb_lower = calc_bb_bands(df["close"], channel_period, mul)
@@ -1105,14 +1102,17 @@ class FmpChartData(FmpBase):
             >>> print(fmp.return_chart())
         """
         chart = self.chart.copy()
+
+        # Same weights and gap filling as ta's WMAIndicator, but computed as one
+        # matrix product over a strided window view instead of rolling().apply().
+        close = chart["close"].to_numpy(dtype=float)
+        wma = np.full(len(close), np.nan)
+        if len(close) >= period:
+            weights = np.arange(1, period + 1) * 2 / (period * (period + 1))
+            wma[period - 1 :] = sliding_window_view(close, period) @ weights
+
         chart[f"wma{period}"] = (
-            WMAIndicator(
-                close=chart["close"],
-                window=period,
-                fillna=True,
-            )
-            .wma()
-            .round(2)
+            pd.Series(wma, index=chart.index).ffill().fillna(0).round(2)
         )
 
         self.chart = chart
@@ -1,9 +1,6 @@
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 """
 This class provides methods for searching for companies on Financial Modeling Prep (FMP).
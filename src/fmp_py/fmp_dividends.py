@@ -3,9 +3,7 @@ import os
 import pendulum
 from fmp_py.fmp_base import FmpBase
 import pandas as pd
-from dotenv import load_dotenv
 
-load_dotenv()
 """
 This class is used to access the FMP dividends endpoints.
 Reference: https://site.financialmodelingprep.com/developer/docs#dividends
@@ -2,9 +2,6 @@ import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
 import pendulum
-from dotenv import load_dotenv
-
-load_dotenv()
 
 pd.set_option("future.no_silent_downcasting", True)
 
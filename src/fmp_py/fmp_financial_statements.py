@@ -1,9 +1,6 @@
 from fmp_py.fmp_base import FmpBase
 import pandas as pd
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 """
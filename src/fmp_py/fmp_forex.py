@@ -2,9 +2,20 @@ import pendulum
 from fmp_py.fmp_base import FmpBase
 import pandas as pd
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+INTERVAL_OPTIONS = frozenset(
+    {
+        "1min",
+        "5min",
+        "15min",
+        "30min",
+        "1hour",
+        "4hour",
+        "1day",
+        "1week",
+        "1month",
+    }
+)
 
 
 class FmpForex(FmpBase):
@@ -111,17 +122,7 @@ class FmpForex(FmpBase):
 
         clean_symbol = symbol.replace("/", "")
 
-        if interval not in [
-            "1min",
-            "5min",
-            "15min",
-            "30min",
-            "1hour",
-            "4hour",
-            "1day",
-            "1week",
-            "1month",
-        ]:
+        if interval not in INTERVAL_OPTIONS:
             raise ValueError(
                 "Invalid interval. Please choose from: 1min, 5min, 15min, 30min, 1hour, 4hour, 1day, 1week, 1month"
             )
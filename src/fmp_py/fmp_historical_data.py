@@ -1,13 +1,16 @@
 # src/fmp_py/fmp_historical_data.py
 # Define the FmpHistoricalData class that inherits from FmpBase.
+import numpy as np
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 
-# from typing import Dict, Any
+from typing import Dict, Any, List
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+INTERVAL_OPTIONS = frozenset(
+    {"1min", "5min", "15min", "30min", "1hour", "4hour", "1day"}
+)
+FLOAT_COLUMNS = frozenset({"open", "high", "low", "close", "vwap"})
 
 
 class FmpHistoricalData(FmpBase):
@@ -23,7 +26,9 @@ class FmpHistoricalData(FmpBase):
     ############################
     # Historical Daily Prices
     ############################
-    def daily_history(self, symbol: str, from_date: str, to_date: str) -> pd.DataFrame:
+    def daily_history(
+        self, symbol: str, from_date: str, to_date: str, dtype: type = np.float64
+    ) -> pd.DataFrame:
         """
         Retrieves daily historical data for a given symbol within a specified date range.
 
@@ -31,6 +36,7 @@ class FmpHistoricalData(FmpBase):
             symbol (str): The symbol of the stock or asset.
             from_date (str): The starting date of the historical data in the format 'YYYY-MM-DD'.
             to_date (str): The ending date of the historical data in the format 'YYYY-MM-DD'.
+            dtype (type): The float type of the price and VWAP columns. Pass np.float32 to halve their memory. Defaults to np.float64.
 
         Returns:
             pd.DataFrame: A DataFrame containing the daily historical data for the specified symbol.
@@ -44,7 +50,9 @@ class FmpHistoricalData(FmpBase):
         if not data:
             raise ValueError("No data found for the specified parameters.")
 
-        data_df = self._prepare_data(pd.DataFrame(data))
+        data_df = self._prepare_data(
+            data, ["open", "high", "low", "close", "volume", "vwap"], dtype
+        )
         return data_df.sort_values(by="date").set_index("date")[
             ["open", "high", "low", "close", "volume", "vwap"]
         ]
@@ -53,7 +61,12 @@ class FmpHistoricalData(FmpBase):
     # Intraday Historical Prices
     ############################
     def intraday_history(
-        self, symbol: str, interval: str, from_date: str, to_date: str
+        self,
+        symbol: str,
+        interval: str,
+        from_date: str,
+        to_date: str,
+        dtype: type = np.float64,
     ) -> pd.DataFrame:
         """
         Retrieves intraday historical data for a given symbol within a specified time interval.
@@ -63,13 +76,15 @@ class FmpHistoricalData(FmpBase):
             interval (str): The time interval for the data. Must be one of: ['1min', '5min', '15min', '30min', '1hour', '4hour'].
             from_date (str): The starting date for the data in the format 'YYYY-MM-DD'.
             to_date (str): The ending date for the data in the format 'YYYY-MM-DD'.
+            dtype (type): The float type of the price columns. Pass np.float32 to halve their memory. Defaults to np.float64.
 
         Returns:
             pd.DataFrame: A DataFrame containing the intraday historical data for the specified symbol and time interval.
         """
-        interval_options = ["1min", "5min", "15min", "30min", "1hour", "4hour", "1day"]
-        if interval not in interval_options:
-            raise ValueError(f"Interval must be one of: {interval_options}")
+        if interval not in INTERVAL_OPTIONS:
+            raise ValueError(
+                "Interval must be one of: 1min, 5min, 15min, 30min, 1hour, 4hour, 1day"
+            )
 
         url = f"v3/historical-chart/{interval}/{symbol}"
         params = {"from": from_date, "to": to_date}
@@ -78,36 +93,76 @@ class FmpHistoricalData(FmpBase):
         if not response:
             raise ValueError("No data found for the specified parameters.")
 
-        data_df = self._prepare_data(pd.DataFrame(response))
+        # Keep every field the API sent, in the order it sent them
+        columns = [key for key in response[0] if key != "date"]
+        data_df = self._prepare_data(response, columns, dtype)
         return data_df.sort_values(by="date").set_index("date")
 
     ############################
     # Prepare Data
     ############################
-    def _prepare_data(self, data_df: pd.DataFrame) -> pd.DataFrame:
+    def _prepare_data(
+        self,
+        records: List[Dict[str, Any]],
+        columns: List[str],
+        dtype: type = np.float64,
+    ) -> pd.DataFrame:
         """
-        Prepare data by calculating VWAP and converting data types.
+        Prepare data by converting the raw records to a typed DataFrame and rounding prices.
 
         Args:
-            data_df (pd.DataFrame): Raw data.
+            records (List[Dict[str, Any]]): Raw price records from the API.
+            columns (List[str]): The numeric columns to keep alongside the date.
+            dtype (type): The float type of the non-volume columns. Defaults to np.float64.
 
         Returns:
             pd.DataFrame: Prepared data.
         """
         # data_df["vwap"] = self._calc_vwap(data_df)
-        data_df = data_df.astype(
-            {
-                "date": "datetime64[ns]",
-                "open": "float",
-                "high": "float",
-                "low": "float",
-                "close": "float",
-                "volume": "int64",
-                # "vwap": "float",
-            }
-        )
+        data_df = self._records_to_frame(records, columns, dtype)
         return self._round_prices(data_df)
 
+    ############################
+    # Records to Frame
+    ############################
+    def _records_to_frame(
+        self,
+        records: List[Dict[str, Any]],
+        columns: List[str],
+        dtype: type = np.float64,
+    ) -> pd.DataFrame:
+        """
+        Build a DataFrame column by column from a list of price records.
+
+        Each price and volume column is read straight into a typed NumPy array, so the
+        frame is never built row by row through object-dtype columns.
+
+        Args:
+            records (List[Dict[str, Any]]): Raw price records from the API.
+            columns (List[str]): The columns to keep alongside the date, in output order.
+            dtype (type): The float type of the price and VWAP columns. Defaults to np.float64.
+
+        Returns:
+            pd.DataFrame: DataFrame with a datetime64 date column, an int64 volume column,
+            dtype price and VWAP columns, and any other column in the type pandas infers.
+        """
+        count = len(records)
+        # NumPy parses both "YYYY-MM-DD" and "YYYY-MM-DD HH:MM:SS" natively
+        data = {
+            "date": np.array(
+                [record["date"] for record in records], dtype="datetime64[ns]"
+            )
+        }
+        for column in columns:
+            values = (record[column] for record in records)
+            if column == "volume":
+                data[column] = np.fromiter(values, dtype=np.int64, count=count)
+            elif column in FLOAT_COLUMNS:
+                data[column] = np.fromiter(values, dtype=dtype, count=count)
+            else:
+                data[column] = list(values)
+        return pd.DataFrame(data, copy=False)
+
     ############################
     # Round Prices
     ############################
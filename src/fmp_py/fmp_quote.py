@@ -3,7 +3,6 @@ import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
 import pendulum
-from dotenv import load_dotenv
 
 from fmp_py.models.quote import (
     AftermarketTrade,
@@ -18,8 +17,6 @@ from fmp_py.models.quote import (
     SimpleQuote,
 )
 
-load_dotenv()
-
 """
 def full_quote(self, symbol: str) -> Quote:
     Reference: https://site.financialmodelingprep.com/developer/docs#full-quote-quote
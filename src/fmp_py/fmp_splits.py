@@ -2,9 +2,6 @@ import pandas as pd
 import pendulum
 from fmp_py.fmp_base import FmpBase
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 """
 Retrieves Stock Spilts Data from Financial Modeling Prep API
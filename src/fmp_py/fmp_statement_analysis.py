@@ -3,12 +3,9 @@
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
-from dotenv import load_dotenv
 
 from fmp_py.models.statement_analysis import FinancialScore, Ratios, KeyMetrics
 
-load_dotenv()
-
 """
 The FmpStatementAnalysis class provides methods for retrieving financial statement analysis data from the Financial Modeling Prep API.
 
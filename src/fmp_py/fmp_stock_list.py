@@ -2,9 +2,6 @@ from typing import List
 import pandas as pd
 from fmp_py.fmp_base import FmpBase
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 """
 Defines the FmpStockList class that inherits from FmpBase.
@@ -4,9 +4,6 @@ from fmp_py.fmp_base import FmpBase
 from fmp_py.models.upgrades_downgrades import UpgradesDowngrades
 
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 """
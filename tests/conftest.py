@@ -0,0 +1,205 @@
+import contextlib
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from dotenv import find_dotenv, load_dotenv
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+SESSION_CASSETTE = CASSETTE_DIR / "statement_analysis_session.yaml"
+
+
+def cassettes_recorded():
+    """
+    Return True when tests/cassettes/ holds at least one recorded cassette.
+    """
+    return any(CASSETTE_DIR.rglob("*.yaml"))
+
+
+def pytest_configure(config):
+    """
+    Load the project's .env once per test process, from the invocation directory.
+    """
+    load_dotenv(find_dotenv(usecwd=True), override=False)
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip tests marked network without a real API key, since they never replay cassettes.
+    """
+    if os.getenv("FMP_API_KEY"):
+        return
+    skip_network = pytest.mark.skip(reason="network tests need FMP_API_KEY")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+def pytest_report_header(config):
+    """
+    Show which data source the API tests will use.
+    """
+    record_mode = config.getoption("--record-mode")
+    if record_mode:
+        source = f"live API (recording cassettes, mode {record_mode})"
+    elif cassettes_recorded():
+        source = "recorded cassettes"
+    elif os.getenv("FMP_API_KEY"):
+        source = "live API"
+    else:
+        source = "none (API tests will be skipped)"
+    cache = "on" if os.getenv("FMP_TEST_USE_CACHE") == "1" else "off"
+    return f"fmp-py: data source: {source}, response cache: {cache}"
+
+
+@pytest.fixture(scope="session")
+def vcr_config():
+    """
+    Strip the API key from recorded requests.
+
+    Recording is opt-in through pytest-recording's --record-mode option, so
+    cassettes in tests/cassettes/ are only replayed by default.
+    """
+    return {
+        "filter_headers": ["authorization"],
+        "filter_query_parameters": ["apikey"],
+    }
+
+
+@pytest.fixture(scope="session")
+def disable_recording(request):
+    """
+    Talk to the live API when no cassettes are committed and --record-mode is not
+    given, instead of failing every request in strict playback.
+    """
+    if request.config.getoption("--disable-recording"):
+        return True
+    return (
+        request.config.getoption("--record-mode") is None and not cassettes_recorded()
+    )
+
+
+@pytest.fixture
+def vcr_markers(request):
+    """
+    Keep tests marked network out of any cassette so they always reach the live API.
+    """
+    if request.node.get_closest_marker("network"):
+        return []
+    return list(request.node.iter_markers(name="vcr"))
+
+
+@pytest.fixture(scope="session")
+def session_cassette(record_mode, disable_recording, vcr_config):
+    """
+    Return a factory for the cassette that wraps requests made by session fixtures.
+
+    pytest-recording only installs a cassette around each test function, after the
+    session fixtures have already been set up, so their requests are recorded to and
+    replayed from a shared cassette of their own instead.
+    """
+    if disable_recording:
+        return contextlib.nullcontext
+
+    import vcr
+
+    if record_mode in ("all", "rewrite"):
+        SESSION_CASSETTE.unlink(missing_ok=True)
+    # Every session fixture reopens the cassette, so a write-once mode would reject
+    # the requests of all but the first
+    if record_mode in ("once", "rewrite"):
+        record_mode = "new_episodes"
+
+    recorder = vcr.VCR(record_mode=record_mode, **vcr_config)
+    return functools.partial(recorder.use_cassette, str(SESSION_CASSETTE))
+
+
+@pytest.fixture(scope="session")
+def statement_analysis():
+    """
+    Build a single FmpStatementAnalysis client shared by the whole test session.
+
+    Set FMP_TEST_USE_CACHE=1 to serve repeated requests from a local SQLite
+    response cache instead of the live API. Without FMP_API_KEY the client
+    falls back to a placeholder key when recorded cassettes are available.
+    """
+    api_key = os.getenv("FMP_API_KEY")
+    if not api_key:
+        if not cassettes_recorded():
+            pytest.skip("FMP_API_KEY is not set and no cassettes are recorded")
+        api_key = "cassette-replay"
+
+    from fmp_py.fmp_statement_analysis import FmpStatementAnalysis
+
+    client = FmpStatementAnalysis(api_key=api_key)
+
+    if os.getenv("FMP_TEST_USE_CACHE") == "1":
+        import requests_cache
+
+        client.session.close()
+        client.session = requests_cache.CachedSession(
+            cache_name=".fmp_test_cache",
+            backend="sqlite",
+            expire_after=timedelta(days=7),
+            ignored_parameters=["apikey"],
+            wal=True,
+        )
+        client.session.mount("https://", client.adapter)
+        client.session.mount("http://", client.adapter)
+
+    return client
+
+
+@pytest.fixture(scope="session")
+def prefetch(request):
+    """
+    Warm the response cache for every AAPL request the suite makes, in parallel,
+    so the tests themselves are served from the cache.
+    """
+    if os.getenv("FMP_TEST_USE_CACHE") != "1":
+        return
+
+    statement_analysis = request.getfixturevalue("statement_analysis")
+    session_cassette = request.getfixturevalue("session_cassette")
+
+    endpoints = [
+        "financial_score",
+        "ratios_ttm",
+        "key_metrics_ttm",
+        "enterprise_values",
+        "owner_earnings",
+    ]
+    period_endpoints = [
+        "key_metrics",
+        "ratios",
+        "cashflow_growth",
+        "income_growth",
+        "financial_growth",
+        "balance_sheet_growth",
+    ]
+    calls = [(name, {}) for name in endpoints + period_endpoints]
+    calls += [(name, {"limit": 10}) for name in period_endpoints]
+
+    with session_cassette(), ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(getattr(statement_analysis, name), "AAPL", **kwargs)
+            for name, kwargs in calls
+        ]
+        for future in futures:
+            future.result()
+
+
+@pytest.fixture
+def uncached(statement_analysis):
+    """
+    Bypass the response cache so error responses are never stored.
+    """
+    session = statement_analysis.session
+    if hasattr(session, "cache_disabled"):
+        with session.cache_disabled():
+            yield
+    else:
+        yield
@@ -0,0 +1,45 @@
+import re
+from datetime import datetime, timedelta, timezone
+
+import pendulum
+import pytest
+
+from fmp_py.fmp_base import EXCHANGE_TIMEZONE, FmpBase
+
+
+def test_fmp_base_enable_cache(tmp_path, requests_mock):
+    requests_mock.get(re.compile("financialmodelingprep.com"), json=[{"close": 1.0}])
+    fmp = FmpBase(api_key="test")
+    fmp.enable_cache(cache_name=str(tmp_path / "fmp_cache"))
+
+    for _ in range(2):
+        response = fmp.get_request(
+            "v3/historical-chart/1day/AAPL", {"from": "2021-01-01", "to": "2021-01-10"}
+        )
+        assert response == [{"close": 1.0}]
+
+    assert requests_mock.call_count == 1
+    cached = list(fmp.session.cache.responses.values())
+    assert len(cached) == 1
+    # Closed windows are kept longer, but still expire to pick up later adjustments
+    assert cached[0].expires is not None
+    assert cached[0].expires - datetime.now(timezone.utc) > timedelta(days=6)
+
+
+@pytest.mark.parametrize("days_ago", [0, 1])
+def test_fmp_base_enable_cache_recent_window(tmp_path, requests_mock, days_ago):
+    requests_mock.get(re.compile("financialmodelingprep.com"), json=[{"close": 1.0}])
+    fmp = FmpBase(api_key="test")
+    fmp.enable_cache(cache_name=str(tmp_path / "fmp_cache"))
+
+    to_date = pendulum.today(EXCHANGE_TIMEZONE).subtract(days=days_ago)
+    fmp.get_request(
+        "v3/historical-chart/1day/AAPL",
+        {"from": "2021-01-01", "to": to_date.to_date_string()},
+    )
+
+    cached = list(fmp.session.cache.responses.values())
+    assert len(cached) == 1
+    assert cached[0].expires - datetime.now(timezone.utc) < timedelta(
+        hours=1, minutes=1
+    )
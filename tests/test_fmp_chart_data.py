@@ -1,3 +1,5 @@
+import re
+
 import pandas as pd
 import pytest
 from fmp_py.fmp_chart_data import FmpChartData
@@ -8,10 +10,36 @@ def fmp():
     return FmpChartData(symbol="AAPL", from_date="2021-01-01", to_date="2021-01-10")
 
 
+@pytest.fixture
+def offline_fmp(requests_mock):
+    requests_mock.get(
+        re.compile("historical-chart"),
+        json=[
+            {
+                "date": "2021-01-04",
+                "open": 133.52,
+                "high": 133.61,
+                "low": 126.76,
+                "close": 129.41,
+                "volume": 143301900,
+            }
+        ],
+    )
+    return FmpChartData(
+        symbol="AAPL", from_date="2021-01-01", to_date="2021-01-10", api_key="test"
+    )
+
+
 def test_fmp_chart_data_init(fmp):
     assert isinstance(fmp, FmpChartData)
 
 
+def test_fmp_chart_data_uses_own_session_and_api_key(requests_mock, offline_fmp):
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.qs["apikey"] == ["test"]
+    assert offline_fmp.return_chart()["close"].iloc[0] == 129.41
+
+
 def test_fmp_chart_data_return_chart(fmp):
     fmp_chart = fmp.return_chart()
     assert isinstance(fmp_chart, pd.DataFrame)
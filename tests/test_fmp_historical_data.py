@@ -1,3 +1,5 @@
+import re
+
 import numpy as np
 import pytest
 
@@ -56,6 +58,53 @@ def test_fmp_historical_data_intraday_history(fmp_historical_data):
     assert isinstance(data.iloc[0]["volume"], np.float64)
 
 
+def test_fmp_historical_data_intraday_history_float32(requests_mock):
+    requests_mock.get(
+        re.compile("historical-chart"),
+        json=[
+            {
+                "date": f"2023-01-03 09:3{i}:00",
+                "open": 130.28 + i,
+                "high": 130.9 + i,
+                "low": 129.89 + i,
+                "close": 130.73 + i,
+                "volume": 1000 + i,
+            }
+            for i in range(5)
+        ],
+    )
+    fmp = FmpHistoricalData(api_key="test")
+    prices = ["open", "high", "low", "close"]
+    data64 = fmp.intraday_history("AAPL", "1min", "2023-01-03", "2023-01-03")
+    data32 = fmp.intraday_history(
+        "AAPL", "1min", "2023-01-03", "2023-01-03", dtype=np.float32
+    )
+    assert (data32[prices].dtypes == np.float32).all()
+    assert data32["volume"].dtype == np.int64
+    np.testing.assert_allclose(data32[prices], data64[prices], rtol=1e-5)
+
+
+def test_fmp_historical_data_intraday_history_keeps_api_columns(requests_mock):
+    requests_mock.get(
+        re.compile("historical-chart"),
+        json=[
+            {
+                "date": "2023-01-03 09:30:00",
+                "open": 130.28,
+                "low": 129.89,
+                "high": 130.9,
+                "close": 130.73,
+                "volume": 1000,
+                "label": "Jan 03",
+            }
+        ],
+    )
+    fmp = FmpHistoricalData(api_key="test")
+    data = fmp.intraday_history("AAPL", "1min", "2023-01-03", "2023-01-03")
+    assert list(data.columns) == ["open", "low", "high", "close", "volume", "label"]
+    assert data["label"].iloc[0] == "Jan 03"
+
+
 def test_fmp_historical_data_intraday_history_with_invalid_symbol(fmp_historical_data):
     symbol = "INVALID_SYMBOL"
     interval = "1min"